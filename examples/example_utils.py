@@ -0,0 +1,135 @@
+"""
+Helpers shared by the example integrations in this directory.
+
+These are not part of the library itself; they only remove boilerplate that
+every example would otherwise repeat.
+"""
+
+import os
+import threading
+import time
+
+try:
+    from inotify_simple import INotify, flags
+except ImportError:
+    INotify = None
+
+
+OUTPUT_SUBDIRS = ('in_proc', 'metadata', 'wl_consumed', 'txns')
+
+
+def setup_directories(output_dir, subdirs=OUTPUT_SUBDIRS):
+    """
+    Create the vending machine output directory and its subdirectories.
+
+    The output directory is scanned once (or created, with any missing
+    parents, if it is absent) and only the children that are not already
+    directories get a mkdir, so a rerun against an existing layout issues no
+    mkdir calls at all.
+
+    :return: Mapping of each subdirectory name to its joined path
+    """
+    try:
+        with os.scandir(output_dir) as entries:
+            existing = {entry.name for entry in entries if entry.is_dir()}
+    except FileNotFoundError:
+        os.makedirs(output_dir)
+        existing = set()
+    subdir_paths = {subdir: os.path.join(output_dir, subdir) for subdir in subdirs}
+    for subdir, subdir_path in subdir_paths.items():
+        if subdir in existing:
+            continue
+        try:
+            os.mkdir(subdir_path)
+        except FileExistsError:
+            pass
+    return subdir_paths
+
+
+class DirectoryWatcher:
+    """
+    Wait between vend cycles, waking early when a watched directory changes or
+    when another thread calls wake().
+
+    Payments arrive on-chain, so the watch only lets operator-side changes
+    (e.g., restocking the metadata directory or editing the whitelist) be
+    picked up sooner.  Integrations that learn about payments some other way
+    (e.g., a payment notification listener) can call wake() from their own
+    thread to start the next cycle without waiting out the poll interval.
+    Every wake runs a full vend cycle, including its Blockfrost address poll,
+    so a wait never returns before min_interval seconds even if wakes keep
+    arriving (e.g., during a restock copy); wakes during one wait coalesce.
+    When inotify_simple is not installed (or not on Linux) only wake() and the
+    timeout end a wait.  Only additions are watched because the vending
+    machine itself moves files out of these directories while vending.
+    """
+
+    _WATCH_FLAGS = 0 if INotify is None else (flags.CREATE | flags.MOVED_TO)
+    _READ_TIMEOUT_MS = 1000
+
+    def __init__(self, paths, min_interval=5):
+        self.min_interval = min_interval
+        self._wake_event = threading.Event()
+        self._closed = threading.Event()
+        self._inotify = None
+        self._reader = None
+        if INotify is None:
+            return
+        try:
+            self._inotify = INotify()
+            watched = 0
+            for path in paths:
+                if path and os.path.isdir(path):
+                    self._inotify.add_watch(path, DirectoryWatcher._WATCH_FLAGS)
+                    watched += 1
+        except OSError:
+            self.close()
+            return
+        if not watched:
+            self.close()
+            return
+        self._reader = threading.Thread(target=self._read_events, daemon=True)
+        self._reader.start()
+
+    def _read_events(self):
+        while not self._closed.is_set():
+            try:
+                events = self._inotify.read(timeout=DirectoryWatcher._READ_TIMEOUT_MS, read_delay=100)
+            except (OSError, ValueError):
+                return
+            if events:
+                self._wake_event.set()
+
+    def wake(self):
+        """
+        Make the current (or next) wait() return as soon as min_interval allows;
+        safe to call from any thread
+        """
+        self._wake_event.set()
+
+    def wait(self, timeout):
+        """
+        Block for up to timeout seconds or until woken, but always for at
+        least min_interval seconds
+        """
+        started = time.monotonic()
+        self._wake_event.wait(timeout)
+        self._wake_event.clear()
+        remaining = min(self.min_interval, timeout) - (time.monotonic() - started)
+        if remaining > 0:
+            time.sleep(remaining)
+
+    def close(self):
+        self._closed.set()
+        if self._reader is not None and self._reader is not threading.current_thread():
+            self._reader.join()
+            self._reader = None
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -13,18 +13,28 @@ This example shows a complete, production-ready setup with:
 Use Case: Professional NFT drop with all features enabled
 """
 
+import atexit
 import json
 import os
+import pickle
+import tempfile
 import time
-from datetime import datetime
-from cardano.wt.bonuses.bogo import Bogo
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from cardano.wt.blockfrost import BlockfrostApi
 from cardano.wt.cardano_cli import CardanoCli
 from cardano.wt.mint import Mint
 from cardano.wt.nft_vending_machine import NftVendingMachine
 from cardano.wt.utxo import Balance
-from cardano.wt.whitelist.asset_whitelist import SingleUseWhitelist
 from cardano.wt.whitelist.no_whitelist import NoWhitelist
+from example_utils import OUTPUT_SUBDIRS, DirectoryWatcher, setup_directories
+
+# Set VENDING_MACHINE_DEBUG=1 to also log the full vending machine configuration
+DEBUG = bool(os.environ.get("VENDING_MACHINE_DEBUG"))
 
 
 class VendingMachineConfig:
@@ -32,12 +42,54 @@ class VendingMachineConfig:
     Configuration management for vending machine
     """
     
+    CACHE_SUFFIX = '.cache.pkl'
+    
     def __init__(self, config_file=None):
-        if config_file and os.path.exists(config_file):
-            with open(config_file, 'r') as f:
-                self.config = json.load(f)
-        else:
-            self.config = self._default_config()
+        self._config_file = config_file if config_file and os.path.exists(config_file) else None
+        self._config = None
+        self._flat = None
+    
+    @property
+    def config(self):
+        """Parsed configuration, loaded on first access"""
+        if self._config is None:
+            if self._config_file:
+                self._config = self._load_cached(self._config_file)
+            else:
+                self._config = self._default_config()
+            self._flat = self._flatten(self._config)
+        return self._config
+    
+    def _flatten(self, config, prefix=''):
+        """Map every nested key path to its value using dotted keys"""
+        flat = {}
+        for key, value in config.items():
+            dotted_key = f"{prefix}{key}"
+            flat[dotted_key] = value
+            if isinstance(value, dict):
+                flat.update(self._flatten(value, f"{dotted_key}."))
+        return flat
+    
+    def _load_cached(self, config_file):
+        """Load the parsed config from its pickle sidecar, re-parsing if stale"""
+        cache_file = f"{config_file}{VendingMachineConfig.CACHE_SUFFIX}"
+        try:
+            if os.stat(cache_file).st_mtime >= os.stat(config_file).st_mtime:
+                with open(cache_file, 'rb') as f:
+                    return pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            pass
+        with open(config_file, 'rb') as f:
+            raw_config = f.read()
+        config = orjson.loads(raw_config) if orjson else json.loads(raw_config)
+        try:
+            fd, tmp_file = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(config_file)))
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(config, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            pass
+        return config
     
     def _default_config(self):
         return {
@@ -86,7 +138,12 @@ class VendingMachineConfig:
     
     def get(self, *keys):
         """Get nested config value"""
-        value = self.config
+        config = self.config
+        try:
+            return self._flat['.'.join(keys)]
+        except KeyError:
+            pass
+        value = config
         for key in keys:
             value = value[key]
         return value
@@ -99,38 +156,38 @@ class VendingMachineConfig:
                 config[key] = {}
             config = config[key]
         config[keys[-1]] = value
+        self._flat = self._flatten(self._config)
     
     def save(self, config_file):
         """Save configuration to file"""
-        with open(config_file, 'w') as f:
-            json.dump(self.config, f, indent=2)
-
-
-def setup_directories(output_dir):
-    """Create necessary directory structure"""
-    dirs = [
-        output_dir,
-        os.path.join(output_dir, 'in_proc'),
-        os.path.join(output_dir, 'metadata'),
-        os.path.join(output_dir, 'wl_consumed'),
-        os.path.join(output_dir, 'txns'),
-        os.path.join(output_dir, 'logs')
-    ]
-    for dir_path in dirs:
-        os.makedirs(dir_path, exist_ok=True)
+        if orjson:
+            with open(config_file, 'wb') as f:
+                f.write(orjson.dumps(self.config, option=orjson.OPT_INDENT_2))
+        else:
+            with open(config_file, 'w') as f:
+                json.dump(self.config, f, indent=2)
+        self._invalidate_cache(config_file)
+    
+    def _invalidate_cache(self, config_file):
+        """Drop the pickle sidecar so the next load re-parses the JSON"""
+        try:
+            os.remove(f"{config_file}{VendingMachineConfig.CACHE_SUFFIX}")
+        except FileNotFoundError:
+            pass
 
 
-def initialize_whitelist(config):
+def initialize_whitelist(config, consumed_dir):
     """Initialize whitelist based on configuration"""
-    whitelist_type = config.get("whitelist", "type")
+    whitelist_cfg = config.get("whitelist")
+    whitelist_type = whitelist_cfg["type"]
     
-    if not config.get("whitelist", "enabled"):
+    if not whitelist_cfg["enabled"]:
         return NoWhitelist()
     
     whitelist_dir = config.get("directories", "whitelist_directory")
-    consumed_dir = os.path.join(config.get("directories", "output_directory"), 'wl_consumed')
     
     if whitelist_type == "single_use":
+        from cardano.wt.whitelist.asset_whitelist import SingleUseWhitelist
         return SingleUseWhitelist(whitelist_dir, consumed_dir)
     elif whitelist_type == "unlimited":
         from cardano.wt.whitelist.asset_whitelist import UnlimitedWhitelist
@@ -144,23 +201,49 @@ def initialize_whitelist(config):
 
 def initialize_bogo(config):
     """Initialize BOGO deals if enabled"""
-    if not config.get("bogo", "enabled"):
+    bogo_cfg = config.get("bogo")
+    if not bogo_cfg["enabled"]:
         return None
     
-    threshold = config.get("bogo", "threshold")
-    bonus = config.get("bogo", "bonus")
-    return Bogo(threshold, bonus)
+    from cardano.wt.bonuses.bogo import Bogo
+    return Bogo(bogo_cfg["threshold"], bogo_cfg["bonus"])
+
+
+_log_fds = {}
+
+
+def _close_log_fds():
+    for log_fd in _log_fds.values():
+        os.close(log_fd)
+    _log_fds.clear()
+
+
+atexit.register(_close_log_fds)
+
+
+_last_log_second = None
+_last_log_prefix = ''
+
+
+def _log_prefix():
+    """Timestamp prefix, rebuilt only when the wall-clock second changes"""
+    global _last_log_second, _last_log_prefix
+    now = int(time.time())
+    if now != _last_log_second:
+        _last_log_second = now
+        _last_log_prefix = f"[{time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(now))}] "
+    return _last_log_prefix
 
 
 def log_event(message, log_file):
     """Log events to file"""
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    log_entry = f"[{timestamp}] {message}\n"
-    
-    with open(log_file, 'a') as f:
-        f.write(log_entry)
+    log_entry = f"{_log_prefix()}{message}"
     
-    print(log_entry.strip())
+    log_fd = _log_fds.get(log_file)
+    if log_fd is None:
+        log_fd = _log_fds[log_file] = os.open(log_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    os.write(log_fd, f"{log_entry}\n".encode())
+    print(log_entry)
 
 
 def run_full_integration():
@@ -171,40 +254,48 @@ def run_full_integration():
     # Load configuration
     config = VendingMachineConfig()
     
+    # Values that stay fixed for the lifetime of the process
+    directories_cfg = config.get("directories")
+    network_cfg = config.get("network")
+    output_dir = directories_cfg["output_directory"]
+    wait_timeout = 15
+    error_timeout = 30
+    
+    # Setup directories (the log file lives inside the output directory)
+    output_paths = setup_directories(output_dir, OUTPUT_SUBDIRS + ('logs',))
+    
     # Log file setup
     log_file = os.path.join(
-        config.get("directories", "output_directory"),
-        "logs",
-        f"vending_machine_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+        output_paths['logs'],
+        f"vending_machine_{time.strftime('%Y%m%d_%H%M%S')}.log"
     )
     
     try:
         log_event("Starting vending machine integration...", log_file)
-        
-        # Setup directories
-        setup_directories(config.get("directories", "output_directory"))
         log_event("Created directory structure", log_file)
         
         # Initialize whitelist
-        whitelist = initialize_whitelist(config)
-        whitelist_desc = config.get("whitelist", "type") if config.get("whitelist", "enabled") else "none"
+        whitelist = initialize_whitelist(config, output_paths['wl_consumed'])
+        whitelist_cfg = config.get("whitelist")
+        whitelist_desc = whitelist_cfg["type"] if whitelist_cfg["enabled"] else "none"
         log_event(f"Initialized whitelist: {whitelist_desc}", log_file)
         
         # Initialize BOGO
         bogo = initialize_bogo(config)
-        bogo_desc = f"Buy {config.get('bogo', 'threshold')} Get {config.get('bogo', 'bonus')}" if bogo else "disabled"
+        bogo_desc = f"Buy {bogo.threshold} Get {bogo.additional}" if bogo else "disabled"
         log_event(f"BOGO deals: {bogo_desc}", log_file)
         
         # Initialize prices
-        prices = [Balance(
-            config.get("mint", "price_lovelace"),
-            config.get("mint", "policy_id")
-        )]
-        log_event(f"Set mint price: {config.get('mint', 'price_lovelace') / 1_000_000} ADA", log_file)
+        mint_cfg = config.get("mint")
+        price_lovelace = mint_cfg["price_lovelace"]
+        prices = [Balance(price_lovelace, mint_cfg["policy_id"])]
+        log_event(f"Set mint price: {price_lovelace / 1_000_000} ADA", log_file)
         
         # Initialize dev fee
-        dev_fee = config.get("fees", "dev_fee_lovelace") if config.get("fees", "enabled") else 0
-        dev_addr = config.get("addresses", "dev_address") if dev_fee else None
+        fees_cfg = config.get("fees")
+        addresses_cfg = config.get("addresses")
+        dev_fee = fees_cfg["dev_fee_lovelace"] if fees_cfg["enabled"] else 0
+        dev_addr = addresses_cfg["dev_address"] if dev_fee else None
         if dev_fee:
             log_event(f"Developer fee: {dev_fee / 1_000_000} ADA per NFT", log_file)
         
@@ -213,9 +304,9 @@ def run_full_integration():
             prices=prices,
             dev_fee=dev_fee,
             dev_addr=dev_addr,
-            nfts_dir=config.get("directories", "metadata_directory"),
-            scripts=[config.get("mint", "script_path")],
-            sign_keys=[config.get("mint", "signing_key")],
+            nfts_dir=directories_cfg["metadata_directory"],
+            scripts=[mint_cfg["script_path"]],
+            sign_keys=[mint_cfg["signing_key"]],
             whitelist=whitelist,
             bogo=bogo
         )
@@ -223,8 +314,8 @@ def run_full_integration():
         # Initialize Blockfrost
         blockfrost_api = BlockfrostApi(
             config.get("blockfrost", "project_id"),
-            mainnet=config.get("network", "mainnet"),
-            preview=config.get("network", "preview")
+            mainnet=network_cfg["mainnet"],
+            preview=network_cfg["preview"]
         )
         log_event("Initialized Blockfrost API", log_file)
         
@@ -232,44 +323,51 @@ def run_full_integration():
         cardano_cli = CardanoCli(protocol_params=None)
         
         # Initialize vending machine
+        vending_cfg = config.get("vending")
         vending_machine = NftVendingMachine(
-            payment_addr=config.get("addresses", "payment_address"),
-            payment_sign_key=config.get("addresses", "payment_signing_key"),
-            profit_addr=config.get("addresses", "profit_address"),
-            vend_randomly=config.get("vending", "vend_randomly"),
-            single_vend_max=config.get("vending", "single_vend_max"),
+            payment_addr=addresses_cfg["payment_address"],
+            payment_sign_key=addresses_cfg["payment_signing_key"],
+            profit_addr=addresses_cfg["profit_address"],
+            vend_randomly=vending_cfg["vend_randomly"],
+            single_vend_max=vending_cfg["single_vend_max"],
             mint=mint,
             blockfrost_api=blockfrost_api,
             cardano_cli=cardano_cli,
-            mainnet=config.get("network", "mainnet")
+            mainnet=network_cfg["mainnet"]
         )
         
         # Validate configuration
         log_event("Validating configuration...", log_file)
         vending_machine.validate()
         log_event("Validation successful!", log_file)
-        log_event(f"Configuration:\n{vending_machine.as_json()}", log_file)
+        if DEBUG:
+            log_event(f"Configuration:\n{vending_machine.as_json()}", log_file)
         
         # Run vending machine
         log_event("Starting vending machine loop...", log_file)
         already_completed = set()
-        wait_timeout = 15
+        watcher = DirectoryWatcher([
+            directories_cfg["metadata_directory"],
+            directories_cfg["whitelist_directory"]
+        ])
         
         while True:
             try:
                 vending_machine.vend(
-                    config.get("directories", "output_directory"),
+                    output_dir,
                     'in_proc',
                     'metadata',
                     already_completed
                 )
-                time.sleep(wait_timeout)
+                watcher.wait(wait_timeout)
             except KeyboardInterrupt:
                 log_event("Vending machine stopped by user", log_file)
+                watcher.close()
+                blockfrost_api.close()
                 break
             except Exception as e:
                 log_event(f"Error in vending loop: {str(e)}", log_file)
-                time.sleep(30)
+                time.sleep(error_timeout)
     
     except Exception as e:
         log_event(f"Fatal error: {str(e)}", log_file)
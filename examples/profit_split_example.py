@@ -16,7 +16,6 @@ Configuration:
 Use Case: Project with artist fees, marketplace fees, or bonus NFTs
 """
 
-import os
 import time
 from cardano.wt.bonuses.bogo import Bogo
 from cardano.wt.blockfrost import BlockfrostApi
@@ -25,6 +24,7 @@ from cardano.wt.mint import Mint
 from cardano.wt.nft_vending_machine import NftVendingMachine
 from cardano.wt.utxo import Balance
 from cardano.wt.whitelist.no_whitelist import NoWhitelist
+from example_utils import setup_directories
 
 
 def run_profit_split_example():
@@ -70,11 +70,7 @@ def run_profit_split_example():
     # INITIALIZATION
     # ==========================================
     
-    os.makedirs(OUTPUT_DIRECTORY, exist_ok=True)
-    os.makedirs(os.path.join(OUTPUT_DIRECTORY, 'in_proc'), exist_ok=True)
-    os.makedirs(os.path.join(OUTPUT_DIRECTORY, 'metadata'), exist_ok=True)
-    os.makedirs(os.path.join(OUTPUT_DIRECTORY, 'wl_consumed'), exist_ok=True)
-    os.makedirs(os.path.join(OUTPUT_DIRECTORY, 'txns'), exist_ok=True)
+    setup_directories(OUTPUT_DIRECTORY)
     
     # No whitelist (public mint with BOGO)
     whitelist = NoWhitelist()
@@ -138,6 +134,8 @@ def run_profit_split_example():
             time.sleep(15)
     except KeyboardInterrupt:
         print("\nVending machine stopped")
+    finally:
+        blockfrost_api.close()
 
 
 def run_multi_profit_example():
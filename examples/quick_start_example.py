@@ -13,7 +13,6 @@ Quick Start Steps:
 For production use, see the other examples in this directory.
 """
 
-import os
 import time
 from cardano.wt.blockfrost import BlockfrostApi
 from cardano.wt.cardano_cli import CardanoCli
@@ -21,6 +20,7 @@ from cardano.wt.mint import Mint
 from cardano.wt.nft_vending_machine import NftVendingMachine
 from cardano.wt.utxo import Balance
 from cardano.wt.whitelist.no_whitelist import NoWhitelist
+from example_utils import setup_directories
 
 
 # ==========================================
@@ -59,11 +59,7 @@ def main():
     print()
     
     # Create output directories
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
-    os.makedirs(os.path.join(OUTPUT_DIR, 'in_proc'), exist_ok=True)
-    os.makedirs(os.path.join(OUTPUT_DIR, 'metadata'), exist_ok=True)
-    os.makedirs(os.path.join(OUTPUT_DIR, 'wl_consumed'), exist_ok=True)
-    os.makedirs(os.path.join(OUTPUT_DIR, 'txns'), exist_ok=True)
+    setup_directories(OUTPUT_DIR)
     
     print("Creating vending machine...")
     
@@ -140,6 +136,8 @@ def main():
     except KeyboardInterrupt:
         print()
         print("Vending machine stopped.")
+    finally:
+        blockfrost_api.close()
 
 
 if __name__ == "__main__":
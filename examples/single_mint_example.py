@@ -14,7 +14,6 @@ Configuration:
 Use Case: Public NFT drop with fixed price
 """
 
-import os
 import time
 from cardano.wt.blockfrost import BlockfrostApi
 from cardano.wt.cardano_cli import CardanoCli
@@ -22,6 +21,7 @@ from cardano.wt.mint import Mint
 from cardano.wt.nft_vending_machine import NftVendingMachine
 from cardano.wt.utxo import Balance
 from cardano.wt.whitelist.no_whitelist import NoWhitelist
+from example_utils import setup_directories
 
 
 def run_single_mint_example():
@@ -66,11 +66,7 @@ def run_single_mint_example():
     # ==========================================
     
     # Create necessary directories
-    os.makedirs(OUTPUT_DIRECTORY, exist_ok=True)
-    os.makedirs(os.path.join(OUTPUT_DIRECTORY, 'in_proc'), exist_ok=True)
-    os.makedirs(os.path.join(OUTPUT_DIRECTORY, 'metadata'), exist_ok=True)
-    os.makedirs(os.path.join(OUTPUT_DIRECTORY, 'wl_consumed'), exist_ok=True)
-    os.makedirs(os.path.join(OUTPUT_DIRECTORY, 'txns'), exist_ok=True)
+    setup_directories(OUTPUT_DIRECTORY)
     
     # Initialize whitelist (no whitelist for public mint)
     whitelist = NoWhitelist()
@@ -144,6 +140,8 @@ def run_single_mint_example():
             time.sleep(wait_timeout)
     except KeyboardInterrupt:
         print("\nVending machine stopped by user")
+    finally:
+        blockfrost_api.close()
 
 
 if __name__ == "__main__":
@@ -16,15 +16,84 @@ Configuration:
 Use Case: Presale with whitelist access
 """
 
+import functools
 import os
-import time
 from cardano.wt.blockfrost import BlockfrostApi
-from cardano.wt.cardano_cli import CardanoCli
+from cardano.wt.cli_native import NativeCli
 from cardano.wt.mint import Mint
 from cardano.wt.nft_vending_machine import NftVendingMachine
 from cardano.wt.utxo import Balance
 from cardano.wt.whitelist.asset_whitelist import SingleUseWhitelist, UnlimitedWhitelist
 from cardano.wt.whitelist.wallet_whitelist import WalletWhitelist
+from example_utils import DirectoryWatcher, setup_directories
+
+# Reuse transaction UTxOs for an hour; protocol parameters are not cached here
+# because NativeCli(protocol_params=None) never asks Blockfrost for them
+BLOCKFROST_CACHE_TTL = {'tx_utxos': 3600}
+
+
+def _build_vm(*, whitelist_cls, whitelist_dir, output_dir, metadata_dir, mint_price_lovelace,
+              single_vend_max, vend_randomly, payment_addr, payment_sign_key, profit_addr,
+              mint_script_path, mint_signing_key, blockfrost_project_id, mainnet, preview=False):
+    """
+    Shared setup for the whitelist examples: creates the output directories,
+    the whitelist of the requested type and the vending machine around it
+    """
+    output_paths = setup_directories(output_dir)
+    whitelist = whitelist_cls(whitelist_dir, output_paths['wl_consumed'])
+    
+    prices = [Balance(mint_price_lovelace, "LOVELACE")]
+    
+    mint = Mint(
+        prices=prices,
+        dev_fee=0,
+        dev_addr=None,
+        nfts_dir=metadata_dir,
+        scripts=[mint_script_path],
+        sign_keys=[mint_signing_key],
+        whitelist=whitelist,
+        bogo=None
+    )
+    
+    blockfrost_api = BlockfrostApi(blockfrost_project_id, mainnet=mainnet, preview=preview, cache_ttl=BLOCKFROST_CACHE_TTL)
+    cardano_cli = NativeCli(protocol_params=None)
+    
+    return NftVendingMachine(
+        payment_addr=payment_addr,
+        payment_sign_key=payment_sign_key,
+        profit_addr=profit_addr,
+        vend_randomly=vend_randomly,
+        single_vend_max=single_vend_max,
+        mint=mint,
+        blockfrost_api=blockfrost_api,
+        cardano_cli=cardano_cli,
+        mainnet=mainnet
+    )
+
+
+def _run_vend_loop(vending_machine, output_dir, watcher):
+    """
+    Vend until interrupted, binding the loop-invariant arguments once
+
+    :param watcher: DirectoryWatcher paced between cycles; call its wake()
+                    from another thread (e.g., a payment notification
+                    listener) to start the next vend without waiting out the
+                    poll interval
+    """
+    # Kept in memory on purpose: vend() also excludes requests that failed,
+    # and a restart should retry those rather than strand the payment
+    already_completed = set()
+    
+    # Closing on the way out drops pooled Blockfrost connections and stops the
+    # watcher even when the loop is stopped with Ctrl+C
+    with vending_machine.blockfrost_api, watcher:
+        vend = functools.partial(vending_machine.vend, output_dir, 'in_proc', 'metadata', already_completed)
+        try:
+            while True:
+                vend()
+                watcher.wait(15)
+        except KeyboardInterrupt:
+            print("\nVending machine stopped")
 
 
 def run_asset_whitelist_example():
@@ -56,67 +125,41 @@ def run_asset_whitelist_example():
     SINGLE_VEND_MAX = 3
     VEND_RANDOMLY = True
     
+    # Single-use whitelist: each asset can mint up to 1 NFT
+    # Alternative: UnlimitedWhitelist for VIP access
+    WHITELIST_TYPE = SingleUseWhitelist
+    
     # ==========================================
     # INITIALIZATION
     # ==========================================
     
-    os.makedirs(OUTPUT_DIRECTORY, exist_ok=True)
-    consumed_dir = os.path.join(OUTPUT_DIRECTORY, 'wl_consumed')
-    os.makedirs(consumed_dir, exist_ok=True)
-    os.makedirs(os.path.join(OUTPUT_DIRECTORY, 'in_proc'), exist_ok=True)
-    os.makedirs(os.path.join(OUTPUT_DIRECTORY, 'metadata'), exist_ok=True)
-    os.makedirs(os.path.join(OUTPUT_DIRECTORY, 'txns'), exist_ok=True)
-    
-    # Single-use whitelist: each asset can mint up to 1 NFT
-    whitelist = SingleUseWhitelist(WHITELIST_DIRECTORY, consumed_dir)
-    
-    # Alternative: Unlimited whitelist for VIP access
-    # whitelist = UnlimitedWhitelist(WHITELIST_DIRECTORY, consumed_dir)
-    
-    prices = [Balance(MINT_PRICE_LOVELACE, "LOVELACE")]
-    
-    mint = Mint(
-        prices=prices,
-        dev_fee=0,
-        dev_addr=None,
-        nfts_dir=METADATA_DIRECTORY,
-        scripts=[MINT_SCRIPT_PATH],
-        sign_keys=[MINT_SIGNING_KEY],
-        whitelist=whitelist,
-        bogo=None
-    )
-    
-    blockfrost_api = BlockfrostApi(BLOCKFROST_PROJECT_ID, mainnet=MAINNET, preview=PREVIEW)
-    cardano_cli = CardanoCli(protocol_params=None)
-    
-    vending_machine = NftVendingMachine(
+    vending_machine = _build_vm(
+        whitelist_cls=WHITELIST_TYPE,
+        whitelist_dir=WHITELIST_DIRECTORY,
+        output_dir=OUTPUT_DIRECTORY,
+        metadata_dir=METADATA_DIRECTORY,
+        mint_price_lovelace=MINT_PRICE_LOVELACE,
+        single_vend_max=SINGLE_VEND_MAX,
+        vend_randomly=VEND_RANDOMLY,
         payment_addr=PAYMENT_ADDRESS,
         payment_sign_key=PAYMENT_SIGNING_KEY,
         profit_addr=PROFIT_ADDRESS,
-        vend_randomly=VEND_RANDOMLY,
-        single_vend_max=SINGLE_VEND_MAX,
-        mint=mint,
-        blockfrost_api=blockfrost_api,
-        cardano_cli=cardano_cli,
-        mainnet=MAINNET
+        mint_script_path=MINT_SCRIPT_PATH,
+        mint_signing_key=MINT_SIGNING_KEY,
+        blockfrost_project_id=BLOCKFROST_PROJECT_ID,
+        mainnet=MAINNET,
+        preview=PREVIEW
     )
     
     # Validate
     print("Validating whitelist vending machine...")
-    vending_machine.validate()
+    vending_machine.validate(cache_file=os.path.join(OUTPUT_DIRECTORY, '.validated'))
     print("Validation successful!")
     print(f"\nVending machine config:\n{vending_machine.as_json()}")
     
     # Run
     print("\nStarting whitelisted vending machine...")
-    already_completed = set()
-    
-    try:
-        while True:
-            vending_machine.vend(OUTPUT_DIRECTORY, 'in_proc', 'metadata', already_completed)
-            time.sleep(15)
-    except KeyboardInterrupt:
-        print("\nVending machine stopped")
+    _run_vend_loop(vending_machine, OUTPUT_DIRECTORY, DirectoryWatcher([METADATA_DIRECTORY, WHITELIST_DIRECTORY]))
 
 
 def run_wallet_whitelist_example():
@@ -150,58 +193,31 @@ def run_wallet_whitelist_example():
     # INITIALIZATION
     # ==========================================
     
-    os.makedirs(OUTPUT_DIRECTORY, exist_ok=True)
-    consumed_dir = os.path.join(OUTPUT_DIRECTORY, 'wl_consumed')
-    os.makedirs(consumed_dir, exist_ok=True)
-    os.makedirs(os.path.join(OUTPUT_DIRECTORY, 'in_proc'), exist_ok=True)
-    os.makedirs(os.path.join(OUTPUT_DIRECTORY, 'metadata'), exist_ok=True)
-    os.makedirs(os.path.join(OUTPUT_DIRECTORY, 'txns'), exist_ok=True)
-    
     # Wallet whitelist: each wallet can mint up to 2 NFTs
-    whitelist = WalletWhitelist(WHITELIST_DIRECTORY, consumed_dir)
-    
-    prices = [Balance(MINT_PRICE_LOVELACE, "LOVELACE")]
-    
-    mint = Mint(
-        prices=prices,
-        dev_fee=0,
-        dev_addr=None,
-        nfts_dir=METADATA_DIRECTORY,
-        scripts=[MINT_SCRIPT_PATH],
-        sign_keys=[MINT_SIGNING_KEY],
-        whitelist=whitelist,
-        bogo=None
-    )
-    
-    blockfrost_api = BlockfrostApi(BLOCKFROST_PROJECT_ID, mainnet=MAINNET)
-    cardano_cli = CardanoCli(protocol_params=None)
-    
-    vending_machine = NftVendingMachine(
+    vending_machine = _build_vm(
+        whitelist_cls=WalletWhitelist,
+        whitelist_dir=WHITELIST_DIRECTORY,
+        output_dir=OUTPUT_DIRECTORY,
+        metadata_dir=METADATA_DIRECTORY,
+        mint_price_lovelace=MINT_PRICE_LOVELACE,
+        single_vend_max=SINGLE_VEND_MAX,
+        vend_randomly=True,
         payment_addr=PAYMENT_ADDRESS,
         payment_sign_key=PAYMENT_SIGNING_KEY,
         profit_addr=PROFIT_ADDRESS,
-        vend_randomly=True,
-        single_vend_max=SINGLE_VEND_MAX,
-        mint=mint,
-        blockfrost_api=blockfrost_api,
-        cardano_cli=cardano_cli,
+        mint_script_path=MINT_SCRIPT_PATH,
+        mint_signing_key=MINT_SIGNING_KEY,
+        blockfrost_project_id=BLOCKFROST_PROJECT_ID,
         mainnet=MAINNET
     )
     
     # Validate and run
     print("Validating wallet whitelist vending machine...")
-    vending_machine.validate()
+    vending_machine.validate(cache_file=os.path.join(OUTPUT_DIRECTORY, '.validated'))
     print("Validation successful!")
     
     print("\nStarting wallet-whitelisted vending machine...")
-    already_completed = set()
-    
-    try:
-        while True:
-            vending_machine.vend(OUTPUT_DIRECTORY, 'in_proc', 'metadata', already_completed)
-            time.sleep(15)
-    except KeyboardInterrupt:
-        print("\nVending machine stopped")
+    _run_vend_loop(vending_machine, OUTPUT_DIRECTORY, DirectoryWatcher([METADATA_DIRECTORY, WHITELIST_DIRECTORY]))
 
 
 if __name__ == "__main__":
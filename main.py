@@ -217,8 +217,9 @@ if __name__ == "__main__":
         logger.info('Successfully validated vending machine configuration!')
     elif _args.command == 'run':
         exclusions = set()
-        while _program_is_running:
-            _nft_vending_machine.vend(_args.output_dir, LOCKED_SUBDIR, METADATA_SUBDIR, exclusions)
-            time.sleep(WAIT_TIMEOUT)
+        with _blockfrost_api:
+            while _program_is_running:
+                _nft_vending_machine.vend(_args.output_dir, LOCKED_SUBDIR, METADATA_SUBDIR, exclusions)
+                time.sleep(WAIT_TIMEOUT)
     else:
         raise ValueError(f"Unknown vending machine subcommand: {_args.subparser_name}")
@@ -1,9 +1,12 @@
 import json
 import logging
 import requests
+import threading
 import time
 
+from concurrent.futures import ThreadPoolExecutor
 from http import HTTPStatus
+from requests.adapters import HTTPAdapter
 
 from cardano.wt import network
 from cardano.wt.utxo import Utxo, Balance
@@ -19,21 +22,55 @@ class BlockfrostApi(object):
     _API_CALLS_PER_SEC = 10
     _APPLICATION_JSON = 'application/json'
     _BACKOFF_SEC = 10
+    _CACHE_MAX_ENTRIES = 1024
     _MAX_GET_RETRIES = 9
     _MAX_POST_RETRIES = 2
     _UTXO_LIST_LIMIT = 100
 
-    def __init__(self, project, mainnet=False, preview=False, max_get_retries=_MAX_GET_RETRIES, max_post_retries=_MAX_POST_RETRIES):
+    def __init__(self, project, mainnet=False, preview=False, max_get_retries=_MAX_GET_RETRIES, max_post_retries=_MAX_POST_RETRIES, cache_ttl=None):
+        """
+        :param cache_ttl: Optional mapping of response category to the number
+            of seconds a response may be reused.  Supported categories are
+            'epoch_params' (protocol parameters) and 'tx_utxos' (transaction
+            inputs/outputs, which never change once on-chain).  Address UTxO
+            listings are never cached since that would hide new payments.
+        """
         self.project = project
         self.mainnet = mainnet
         self.preview = preview
         self.max_get_retries = max_get_retries
         self.max_post_retries = max_post_retries
+        self.cache_ttl = cache_ttl if cache_ttl else {}
+        self.__cache = {}
+        self.__session = None
+        # get_tx_utxos_batch() calls into the cache and session from worker threads
+        self.__lock = threading.Lock()
 
     def __get_api_base(self):
         identifier = 'mainnet' if self.mainnet else 'preview' if self.preview else 'preprod'
         return f"https://cardano-{identifier}.blockfrost.io/api/v0"
 
+    def __get_session(self):
+        with self.__lock:
+            if self.__session is None:
+                session = requests.Session()
+                session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=BlockfrostApi._API_CALLS_PER_SEC))
+                self.__session = session
+            return self.__session
+
+    def close(self):
+        """Close any pooled HTTP connections, a new session is opened on the next call"""
+        with self.__lock:
+            session, self.__session = self.__session, None
+        if session is not None:
+            session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def __call_with_retries(self, call_func, max_retries):
         logger = logging.getLogger(__name__)
         retries = 0
@@ -54,9 +91,28 @@ class BlockfrostApi(object):
                     logger.error(f"Blockfrost API error: Max retries ({max_retries}) exceeded for {call_func}")
                     raise e
 
+    def __cached(self, category, key, fetch_func):
+        ttl = self.cache_ttl.get(category)
+        if not ttl:
+            return fetch_func()
+        cache_key = (category, key)
+        now = time.monotonic()
+        with self.__lock:
+            cached = self.__cache.get(cache_key)
+        if cached and cached[0] > now:
+            return cached[1]
+        # Fetch outside the lock so concurrent lookups of other keys are not serialized
+        value = fetch_func()
+        with self.__lock:
+            self.__cache.pop(cache_key, None)
+            self.__cache[cache_key] = (now + ttl, value)
+            while len(self.__cache) > BlockfrostApi._CACHE_MAX_ENTRIES:
+                self.__cache.pop(next(iter(self.__cache)))
+        return value
+
     def __call_get_api(self, resource):
         return self.__call_with_retries(
-            lambda: requests.get(f"{self.__get_api_base()}/{resource}", headers={'project_id': self.project, 'Content-Type': BlockfrostApi._APPLICATION_JSON}),
+            lambda: self.__get_session().get(f"{self.__get_api_base()}/{resource}", headers={'project_id': self.project, 'Content-Type': BlockfrostApi._APPLICATION_JSON}),
             self.max_get_retries
         )
 
@@ -76,7 +132,7 @@ class BlockfrostApi(object):
 
     def __call_post_api(self, content_type, resource, data):
         return self.__call_with_retries(
-            lambda: requests.post(f"{self.__get_api_base()}/{resource}", headers={'project_id': self.project, 'Content-Type': content_type}, data=data),
+            lambda: self.__get_session().post(f"{self.__get_api_base()}/{resource}", headers={'project_id': self.project, 'Content-Type': content_type}, data=data),
             self.max_post_retries
         )
 
@@ -95,7 +151,32 @@ class BlockfrostApi(object):
             raise e
 
     def get_tx_utxos(self, txn_hash):
-        return self.__call_get_api(f"txs/{txn_hash}/utxos")
+        return self.__cached('tx_utxos', txn_hash, lambda: self.__call_get_api(f"txs/{txn_hash}/utxos"))
+
+    def get_tx_utxos_batch(self, txn_hashes):
+        """
+        Fetch the inputs/outputs of several transactions concurrently, keeping
+        at most _API_CALLS_PER_SEC requests in flight at once.  This bounds
+        concurrency only; it does not throttle the rate of requests per second.
+
+        :param txn_hashes: Transaction hashes to look up (duplicates are fetched once)
+        :return: Mapping of transaction hash to its UTxOs; hashes whose lookup
+            failed are left out so the caller can retry them individually
+        """
+        logger = logging.getLogger(__name__)
+        unique_hashes = list(dict.fromkeys(txn_hashes))
+        if not unique_hashes:
+            return {}
+        tx_utxos = {}
+        num_workers = min(len(unique_hashes), BlockfrostApi._API_CALLS_PER_SEC)
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            futures = {txn_hash: executor.submit(self.get_tx_utxos, txn_hash) for txn_hash in unique_hashes}
+            for txn_hash, future in futures.items():
+                try:
+                    tx_utxos[txn_hash] = future.result()
+                except Exception as e:
+                    logger.warning(f"Could not prefetch UTxOs for {txn_hash}: {e}")
+        return tx_utxos
 
     def get_inputs(self, txn_hash):
         utxo_metadata = self.get_tx_utxos(txn_hash)
@@ -120,7 +201,8 @@ class BlockfrostApi(object):
         logger = logging.getLogger(__name__)
         available_utxos = list()
         for utxo_data in self.__call_paginated_get_api(f"addresses/{address}/utxos"):
-            logger.debug(f'Exclusions list: {[f"{utxo.hash}#{utxo.ix}" for utxo in exclusions]}')
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f'Exclusions list: {[f"{utxo.hash}#{utxo.ix}" for utxo in exclusions]}')
             for raw_utxo in utxo_data:
                 balances = [Balance(int(balance['quantity']), balance['unit']) for balance in raw_utxo['amount']]
                 utxo = Utxo(raw_utxo['tx_hash'], raw_utxo['output_index'], balances)
@@ -131,7 +213,7 @@ class BlockfrostApi(object):
         return available_utxos
 
     def get_protocol_parameters(self):
-        return self.__call_get_api('epochs/latest/parameters')
+        return self.__cached('epoch_params', None, lambda: self.__call_get_api('epochs/latest/parameters'))
 
     def submit_txn(self, signed_file):
         with open(signed_file, 'r') as signed_filehandle:
@@ -0,0 +1,37 @@
+import json
+import logging
+
+from pycardano import Address, NativeScript, Network, PaymentSigningKey, PaymentVerificationKey
+
+from cardano.wt.cardano_cli import CardanoCli
+
+"""
+Drop-in replacement for CardanoCli that derives addresses and policy IDs
+in-process with pycardano instead of forking a cardano-cli subprocess.  These
+are only needed while validating the vending machine, so this mostly helps
+hosts where cardano-cli is slow to start; the per-mint operations (transaction
+building, fee calculation, signing) are inherited unchanged and still run
+cardano-cli, as does any native derivation that fails.
+"""
+class NativeCli(CardanoCli):
+
+    def build_addr(self, payment_sign_key, mainnet=False):
+        logger = logging.getLogger(__name__)
+        try:
+            signing_key = PaymentSigningKey.load(payment_sign_key)
+            verification_key = PaymentVerificationKey.from_signing_key(signing_key)
+            network = Network.MAINNET if mainnet else Network.TESTNET
+            return str(Address(payment_part=verification_key.hash(), network=network))
+        except Exception as e:
+            logger.warning(f"Could not build address for '{payment_sign_key}' natively, using cardano-cli: {e}")
+            return super().build_addr(payment_sign_key, mainnet)
+
+    def policy_id(self, script_file):
+        logger = logging.getLogger(__name__)
+        try:
+            with open(script_file, 'r') as script_handle:
+                script = NativeScript.from_dict(json.load(script_handle))
+            return script.hash().payload.hex()
+        except Exception as e:
+            logger.warning(f"Could not compute policy ID for '{script_file}' natively, using cardano-cli: {e}")
+            return super().policy_id(script_file)
@@ -1,10 +1,35 @@
+import codecs
 import json
 import logging
 import math
 import os
 
+from concurrent.futures import ProcessPoolExecutor
+
 from cardano.wt.utxo import Utxo, Balance
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+def load_metadata_file(filepath):
+    """
+    Parse an NFT metadata file.  Validation and vending both go through here so
+    that a file accepted by Mint.validate() is never rejected at mint time.
+
+    :param filepath: Location of the JSON metadata file on disk
+    """
+    with open(filepath, 'rb') as file:
+        data = file.read()
+    if data.startswith(codecs.BOM_UTF8):
+        data = data[len(codecs.BOM_UTF8):]
+    return _json_loads(data)
+
+def _parse_metadata_files(filepaths):
+    return [load_metadata_file(filepath) for filepath in filepaths]
+
 """
 Representation of the current minting process.
 """
@@ -13,6 +38,8 @@ class Mint(object):
     _METADATA_KEY = '721'
     _METADATA_MAXLEN = 64
     _MIN_PRICE = 5000000
+    _PARALLEL_LOAD_MIN = 1000
+    _PARALLEL_CHUNKS_PER_WORKER = 4
     _POLICY_LEN = 56
 
     class RebateCalculator(object):
@@ -78,11 +105,13 @@ class Mint(object):
             validated_price_policies.append(price.policy)
         logger = logging.getLogger(__name__)
         validated_names = []
-        for filename in os.listdir(self.nfts_dir):
-            with open(os.path.join(self.nfts_dir, filename), 'r') as file:
-                logger.debug(f"Validating '{filename}'")
-                validated_nfts = self.__validated_nft(json.load(file), validated_names, filename)
-                validated_names.extend(validated_nfts)
+        seen_names = set()
+        filenames = os.listdir(self.nfts_dir)
+        for filename, nft in zip(filenames, self.__load_metadata(filenames)):
+            logger.debug(f"Validating '{filename}'")
+            validated_nfts = self.__validated_nft(nft, seen_names, filename)
+            validated_names.extend(validated_nfts)
+            seen_names.update(validated_nfts)
         self.validated_names = validated_names
         for script in self.scripts:
             if not os.path.exists(script):
@@ -94,6 +123,25 @@ class Mint(object):
         logger.info(f"Validating whitelist of type {self.whitelist.__class__}")
         self.whitelist.validate()
 
+    def __load_metadata(self, filenames):
+        """
+        Parse the metadata files in order, spreading the work over a process
+        pool when the directory is large enough to pay for the worker startup.
+        Validation itself stays sequential so duplicates are reported in the
+        same order regardless of how the files were parsed.
+        """
+        filepaths = [os.path.join(self.nfts_dir, filename) for filename in filenames]
+        if len(filepaths) < Mint._PARALLEL_LOAD_MIN:
+            for filepath in filepaths:
+                yield _parse_metadata_files([filepath])[0]
+            return
+        num_workers = os.cpu_count() or 1
+        chunk_size = math.ceil(len(filepaths) / (num_workers * Mint._PARALLEL_CHUNKS_PER_WORKER))
+        chunks = [filepaths[idx:idx + chunk_size] for idx in range(0, len(filepaths), chunk_size)]
+        with ProcessPoolExecutor(max_workers=num_workers) as executor:
+            for parsed_chunk in executor.map(_parse_metadata_files, chunks):
+                yield from parsed_chunk
+
     def __validate_str_lengths(self, metadata):
         if type(metadata) is dict:
             for key, value in metadata.items():
@@ -1,4 +1,5 @@
 import copy
+import hashlib
 import json
 import logging
 import math
@@ -9,7 +10,7 @@ import time
 import traceback
 
 from cardano.wt.cardano_cli import CardanoCli
-from cardano.wt.mint import Mint
+from cardano.wt.mint import Mint, load_metadata_file
 from cardano.wt.utxo import Utxo, Balance
 
 class BadUtxoError(ValueError):
@@ -24,7 +25,13 @@ class NftVendingMachine(object):
     __ERROR_WAIT = 30
 
     def as_json(self):
-        return json.dumps(self, default=lambda o: o.__dict__, sort_keys=True, indent=4)
+        return json.dumps(self, default=NftVendingMachine.__public_fields, sort_keys=True, indent=4)
+
+    @staticmethod
+    def __public_fields(obj):
+        # Private attributes hold runtime state (HTTP sessions, response caches,
+        # directory indexes) rather than configuration, and may not serialize
+        return {key: value for key, value in obj.__dict__.items() if not key.startswith('_')}
 
     def __init__(self, payment_addr, payment_sign_key, profit_addr, vend_randomly, single_vend_max, mint, blockfrost_api, cardano_cli, mainnet=False):
         self.payment_addr = payment_addr
@@ -64,15 +71,14 @@ class NftVendingMachine(object):
         for i in range(num_mints):
             mint_metadata_filename = available_mints.pop(0)
             mint_metadata_orig = os.path.join(self.mint.nfts_dir, mint_metadata_filename)
-            with open(mint_metadata_orig, 'r') as mint_metadata_handle:
-                mint_metadata = json.load(mint_metadata_handle)
-                for policy in mint_metadata['721']:
-                    if policy == 'version':
-                        continue
-                    for nft_name, nft_metadata in mint_metadata['721'][policy].items():
-                        if not policy in combined_nft_metadata:
-                            combined_nft_metadata[policy] = {}
-                        combined_nft_metadata[policy][nft_name] = nft_metadata
+            mint_metadata = load_metadata_file(mint_metadata_orig)
+            for policy in mint_metadata['721']:
+                if policy == 'version':
+                    continue
+                for nft_name, nft_metadata in mint_metadata['721'][policy].items():
+                    if not policy in combined_nft_metadata:
+                        combined_nft_metadata[policy] = {}
+                    combined_nft_metadata[policy][nft_name] = nft_metadata
             mint_metadata_locked = os.path.join(output_dir, locked_subdir, mint_metadata_filename)
             shutil.move(mint_metadata_orig, mint_metadata_locked)
         combined_output_path = os.path.join(output_dir, metadata_subdir, f"{txn_id}.json")
@@ -190,17 +196,21 @@ class NftVendingMachine(object):
             remainder.lovelace = 0
         return payees
 
-    def __do_vend(self, mint_req, output_dir, locked_subdir, metadata_subdir):
+    def __do_vend(self, mint_req, output_dir, locked_subdir, metadata_subdir, utxos=None):
         logger = logging.getLogger(__name__)
         available_mints = sorted(os.listdir(self.mint.nfts_dir))
+        num_available = len(available_mints)
         if not available_mints:
             logger.warning("Metadata directory is empty, please restock the vending machine...")
         elif self.vend_randomly:
-            random.shuffle(available_mints)
+            # No more than single_vend_max files are ever locked per request, so
+            # only draw that many instead of shuffling the whole directory
+            available_mints = random.sample(available_mints, min(self.single_vend_max, num_available))
 
         num_mints_requested = self.__calculate_num_mints_requested(mint_req)
 
-        utxos = self.blockfrost_api.get_tx_utxos(mint_req.hash)
+        if not utxos:
+            utxos = self.blockfrost_api.get_tx_utxos(mint_req.hash)
         utxo_inputs = utxos['inputs']
         utxo_outputs = utxos['outputs']
         input_addrs = set([utxo_input['address'] for utxo_input in utxo_inputs if not utxo_input['reference']])
@@ -210,12 +220,12 @@ class NftVendingMachine(object):
 
         wl_resources = self.mint.whitelist.required_info(mint_req, utxos, self.blockfrost_api)
         wl_availability = self.mint.whitelist.available(wl_resources)
-        num_mints = min(self.single_vend_max, len(available_mints), num_mints_requested, wl_availability)
+        num_mints = min(self.single_vend_max, num_available, num_mints_requested, wl_availability)
 
         bonuses = 0
         if self.mint.bogo:
             eligible_bonuses = self.mint.bogo.determine_bonuses(num_mints_requested)
-            num_mints_plus_bonus = min(self.single_vend_max, len(available_mints), (num_mints + eligible_bonuses))
+            num_mints_plus_bonus = min(self.single_vend_max, num_available, (num_mints + eligible_bonuses))
             logger.info(f"Bonus of {eligible_bonuses} NFTs determined based on {num_mints_requested} (can mint {num_mints_plus_bonus} in total)")
             bonuses = num_mints_plus_bonus - num_mints
             num_mints += bonuses
@@ -253,10 +263,11 @@ class NftVendingMachine(object):
         if not self.__is_validated:
             raise ValueError('Attempting to vend from non-validated vending machine')
         mint_reqs = self.blockfrost_api.get_utxos(self.payment_addr, exclusions)
+        prefetched_utxos = self.blockfrost_api.get_tx_utxos_batch([mint_req.hash for mint_req in mint_reqs])
         for mint_req in mint_reqs:
             exclusions.add(mint_req)
             try:
-                self.__do_vend(mint_req, output_dir, locked_subdir, metadata_subdir)
+                self.__do_vend(mint_req, output_dir, locked_subdir, metadata_subdir, prefetched_utxos.get(mint_req.hash))
             except BadUtxoError as e:
                 logger = logging.getLogger(__name__)
                 logger.error(f"UNRECOVERABLE UTXO ERROR\n{e.utxo}\n^--- REQUIRES INVESTIGATION")
@@ -267,7 +278,16 @@ class NftVendingMachine(object):
                 logger.error(traceback.format_exc())
                 time.sleep(NftVendingMachine.__ERROR_WAIT)
 
-    def validate(self):
+    def validate(self, cache_file=None):
+        """
+        Validate the mint and vending machine configuration before vending.
+
+        :param cache_file: Optional JSON file that remembers the cardano-cli
+                           derived values (payment address, script policy IDs)
+                           across restarts, keyed by a hash of the signing key
+                           and script file contents
+        """
+        cli_cache = NftVendingMachine.__load_cli_cache(cache_file)
         self.mint.validate()
         if self.payment_addr == self.profit_addr:
             raise ValueError(f"Payment address and profit address ({self.payment_addr}) cannot be the same!")
@@ -277,19 +297,56 @@ class NftVendingMachine(object):
                 raise ValueError(f"Price of {price.lovelace} lovelace with dev fee of {self.mint.dev_fee} could lead to a minUTxO error due to rebates")
         if not os.path.exists(self.payment_sign_key):
             raise ValueError(f"Payment signing key file '{self.payment_sign_key}' not found on filesystem")
-        expected_payment_addr = self.cardano_cli.build_addr(self.payment_sign_key, self.mainnet)
+        expected_payment_addr = NftVendingMachine.__cli_result(
+            cli_cache, 'addr', self.payment_sign_key, lambda: self.cardano_cli.build_addr(self.payment_sign_key, self.mainnet), self.mainnet
+        )
         if not expected_payment_addr == self.payment_addr:
             raise ValueError(f"Could not match {self.payment_addr} to signature at '{self.payment_sign_key}' (expected {expected_payment_addr})")
         self.script_map = {}
+        script_policies = {}
         for policy in self.mint.policies:
-            self.script_map[policy] = self.__validate_script_file(policy)
+            self.script_map[policy] = self.__validate_script_file(policy, script_policies, cli_cache)
             if not self.script_map[policy]:
                 raise ValueError(f"No matching script file found for policy {policy}")
+        NftVendingMachine.__save_cli_cache(cache_file, cli_cache)
         self.__is_validated = True
 
-    def __validate_script_file(self, policy):
+    @staticmethod
+    def __load_cli_cache(cache_file):
+        if not cache_file:
+            return None
+        try:
+            with open(cache_file, 'r') as cache_handle:
+                return json.load(cache_handle)
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def __save_cli_cache(cache_file, cli_cache):
+        if not cache_file:
+            return
+        with open(cache_file, 'w') as cache_handle:
+            json.dump(cli_cache, cache_handle, sort_keys=True, indent=4)
+
+    @staticmethod
+    def __cli_result(cli_cache, kind, input_file, cli_func, *qualifiers):
+        if cli_cache is None:
+            return cli_func()
+        with open(input_file, 'rb') as input_handle:
+            digest = hashlib.sha256(input_handle.read()).hexdigest()
+        cache_key = ':'.join([kind, digest] + [str(qualifier) for qualifier in qualifiers])
+        if cache_key in cli_cache:
+            return cli_cache[cache_key]
+        result = cli_func()
+        if result:
+            cli_cache[cache_key] = result
+        return result
+
+    def __validate_script_file(self, policy, script_policies, cli_cache):
         for script in self.mint.scripts:
-            if self.cardano_cli.policy_id(script) == policy:
+            if not script in script_policies:
+                script_policies[script] = NftVendingMachine.__cli_result(cli_cache, 'policy', script, lambda: self.cardano_cli.policy_id(script))
+            if script_policies[script] == policy:
                 return script
         return None
 
@@ -1,5 +1,6 @@
 import sys
 
+from cardano.wt.utxo import Balance
 from cardano.wt.whitelist.filesystem import FilesystemBasedWhitelist
 
 """
@@ -20,6 +21,20 @@ class AssetWhitelist(FilesystemBasedWhitelist):
         """
         return txn_utxos['outputs']
 
+    def _asset_ids(self, wl_resources):
+        """
+        Yield the native asset units found in the UTXO outputs, skipping the
+        lovelace entry present in every output since it can never be
+        whitelisted.
+
+        :param wl_resources: The UTXOs spent in the mint request's input txn
+        """
+        for utxo_output in wl_resources:
+            for utxo_amount in utxo_output['amount']:
+                asset_id = utxo_amount['unit']
+                if asset_id != Balance.LOVELACE_POLICY:
+                    yield asset_id
+
 """
 A whitelist implementation that allows up to N mints per whitelisted asset for
 the duration of the mint (based on how many whitelist slots were initialized
@@ -40,11 +55,8 @@ class SingleUseWhitelist(AssetWhitelist):
         :return: Number of whitelisted assets found in input transaction
         """
         num_whitelisted = 0
-        for utxo_output in wl_resources:
-            utxo_amounts = utxo_output['amount']
-            for utxo_amount in utxo_amounts:
-                asset_id = utxo_amount['unit']
-                num_whitelisted += self.num_whitelisted(asset_id)
+        for asset_id in self._asset_ids(wl_resources):
+            num_whitelisted += self.num_whitelisted(asset_id)
         return num_whitelisted
 
     def consume(self, wl_resources, num_mints):
@@ -59,15 +71,12 @@ class SingleUseWhitelist(AssetWhitelist):
         :param num_mints: How many mints were successfully processed
         """
         remaining_to_remove = num_mints
-        for utxo_output in wl_resources:
-            utxo_amounts = utxo_output['amount']
-            for utxo_amount in utxo_amounts:
-                if not remaining_to_remove:
-                    return
-                asset_id = utxo_amount['unit']
-                num_removed = min(remaining_to_remove, self.num_whitelisted(asset_id))
-                self._remove_from_whitelist(asset_id, num_removed)
-                remaining_to_remove -= num_removed
+        for asset_id in self._asset_ids(wl_resources):
+            if not remaining_to_remove:
+                return
+            num_removed = min(remaining_to_remove, self.num_whitelisted(asset_id))
+            self._remove_from_whitelist(asset_id, num_removed)
+            remaining_to_remove -= num_removed
         if remaining_to_remove != 0:
             raise ValueError(f"[MANUALLY DEBUG] THERE WAS AN OVERMINT FOR A WHITELIST ({remaining_to_remove}), THE MINT WAS ALREADY PROCESSED, INVESTIGATE {wl_resources}")
 
@@ -90,12 +99,9 @@ class UnlimitedWhitelist(AssetWhitelist):
             NOTE: Explicitly skips reference inputs
         :return: sys.maxsize if a whitelisted asset is found, 0 otherwise
         """
-        for utxo_output in wl_resources:
-            utxo_amounts = utxo_output['amount']
-            for utxo_amount in utxo_amounts:
-                asset_id = utxo_amount['unit']
-                if self.num_whitelisted(asset_id) > 0:
-                    return sys.maxsize
+        for asset_id in self._asset_ids(wl_resources):
+            if self.num_whitelisted(asset_id) > 0:
+                return sys.maxsize
         return 0
 
     def consume(self, wl_resources, num_mints):
@@ -1,7 +1,7 @@
-import glob
 import logging
 import os
 import shutil
+import time
 
 """
 Representation of a whitelist that lives on a filesystem where the name of the
@@ -9,16 +9,57 @@ file is the whitelist identifier (e.g., address, stake key).  Note that the
 contents of the file can be empty, or they can be a one-per-line set of linked
 identifiers that need to be removed from the whitelist when this whitelist spot
 is consumed.
+
+Lookups are served from an in-memory index of the whitelist directory that is
+rebuilt whenever the directory's modification time changes, so each check costs
+a single stat instead of a directory scan.  Like git's "racy" index entries, an
+index built within _RACY_WINDOW_NS of the directory's mtime is not trusted: on
+filesystems with coarse timestamps a later change in the same tick would leave
+the mtime untouched, so such lookups rescan until the directory settles.
 """
 class FilesystemBasedWhitelist(object):
 
+    _DIGITS = '0123456789'
+    _RACY_WINDOW_NS = 2000000000
+
     def __init__(self, input_dir, consumed_dir):
         self.input_dir = input_dir
         self.consumed_dir = consumed_dir
+        self.__index = {}
+        self.__index_mtime = None
+        self.__index_built_ns = 0
+
+    def __build_index(self):
+        index = {}
+        with os.scandir(self.input_dir) as entries:
+            for entry in entries:
+                filename = entry.name
+                if filename.startswith('.'):
+                    continue
+                separator = filename.find('_')
+                while separator != -1:
+                    slot_start = separator + 1
+                    if slot_start < len(filename) and filename[slot_start] in FilesystemBasedWhitelist._DIGITS:
+                        index.setdefault(filename[:separator], []).append(entry.path)
+                    separator = filename.find('_', slot_start)
+        return index
+
+    def __refresh_index(self):
+        try:
+            mtime = os.stat(self.input_dir).st_mtime_ns
+        except FileNotFoundError:
+            self.__index = {}
+            self.__index_mtime = None
+            return
+        is_racy = (self.__index_built_ns - mtime) < FilesystemBasedWhitelist._RACY_WINDOW_NS
+        if mtime != self.__index_mtime or is_racy:
+            self.__index_built_ns = time.time_ns()
+            self.__index = self.__build_index()
+            self.__index_mtime = mtime
 
     def __matching_files_for(self, identifier):
-        root_identifier_path = os.path.join(self.input_dir, identifier)
-        return glob.glob(f"{root_identifier_path}_[0-9]*")
+        self.__refresh_index()
+        return list(self.__index.get(identifier, []))
 
     def _remove_from_whitelist(self, identifier, num_removed):
         logger = logging.getLogger(__name__)
@@ -32,9 +73,10 @@ class FilesystemBasedWhitelist(object):
                 linked_id_paths = []
                 with open(identifier_location, 'r') as linked_ids:
                     for linked_id in linked_ids:
-                        linked_id_path = os.path.join(self.input_dir, linked_id.strip())
+                        linked_id = linked_id.strip()
+                        linked_id_path = os.path.join(self.input_dir, linked_id)
                         if not os.path.exists(linked_id_path):
-                            logger.warning(f"Linked ID {linked_id.strip()} was not on whitelist, skipping...")
+                            logger.warning(f"Linked ID {linked_id} was not on whitelist, skipping...")
                             continue
                         linked_id_paths.append(linked_id_path)
                 shutil.move(identifier_location, self.consumed_dir)
@@ -43,6 +85,10 @@ class FilesystemBasedWhitelist(object):
         except Exception as e:
             logger.critical(f"FILESYSTEM ERROR IN WHITELIST, THIS IS BAD! {e}")
             raise
+        finally:
+            # Coarse timestamps can leave the directory mtime unchanged after
+            # our own moves, so never trust the index across a removal
+            self.__index_mtime = None
 
     def num_whitelisted(self, identifier):
         return len(self.__matching_files_for(identifier))
@@ -0,0 +1,151 @@
+import json
+import requests
+import sys
+
+import cardano.wt.blockfrost
+import cardano.wt.nft_vending_machine
+
+from cardano.wt.blockfrost import BlockfrostApi
+from cardano.wt.cardano_cli import CardanoCli
+from cardano.wt.mint import Mint
+from cardano.wt.nft_vending_machine import NftVendingMachine
+from cardano.wt.utxo import Balance, Utxo
+from cardano.wt.whitelist.no_whitelist import NoWhitelist
+
+MINT_PRICE = [Balance(10000000, Balance.LOVELACE_POLICY)]
+
+class FakeResponse(object):
+
+    def __init__(self, url, data):
+        self.url = url
+        self.status_code = 200
+        self.text = json.dumps(data)
+        self.data = data
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.data
+
+def fake_session_get(self, url, **kwargs):
+    return FakeResponse(url, {'min_fee_a': 44})
+
+def test_as_json_after_api_call(monkeypatch, tmp_path):
+    monkeypatch.setattr(requests.Session, 'get', fake_session_get)
+    blockfrost_api = BlockfrostApi('project123', cache_ttl={'epoch_params': 60})
+    assert blockfrost_api.get_protocol_parameters() == {'min_fee_a': 44}
+    mint = Mint(MINT_PRICE, 0, None, str(tmp_path), [], [], NoWhitelist())
+    vending_machine = NftVendingMachine('addr123', None, 'addr456', False, 5, mint, blockfrost_api, CardanoCli(), mainnet=False)
+    serialized = json.loads(vending_machine.as_json())
+    assert serialized['blockfrost_api']['project'] == 'project123'
+    assert serialized['blockfrost_api']['cache_ttl'] == {'epoch_params': 60}
+    assert not [key for key in serialized['blockfrost_api'] if key.startswith('_')], 'Runtime state leaked into as_json()'
+
+class CountingGet(object):
+
+    def __init__(self):
+        self.urls = []
+
+    def __call__(self, session, url, **kwargs):
+        self.urls.append(url)
+        return FakeResponse(url, {'call': len(self.urls)})
+
+def counting_api(monkeypatch, cache_ttl):
+    counting_get = CountingGet()
+    monkeypatch.setattr(requests.Session, 'get', lambda session, url, **kwargs: counting_get(session, url, **kwargs))
+    clock = [1000.0]
+    monkeypatch.setattr(cardano.wt.blockfrost.time, 'monotonic', lambda: clock[0])
+    return BlockfrostApi('project123', cache_ttl=cache_ttl), counting_get, clock
+
+def test_cache_hit_reuses_response(monkeypatch):
+    blockfrost_api, counting_get, clock = counting_api(monkeypatch, {'tx_utxos': 60})
+    first = blockfrost_api.get_tx_utxos('abc')
+    assert blockfrost_api.get_tx_utxos('abc') == first
+    assert len(counting_get.urls) == 1, 'Cached response was fetched again'
+    blockfrost_api.get_tx_utxos('def')
+    assert len(counting_get.urls) == 2, 'Different key should not share a cache entry'
+
+def test_cache_entry_expires(monkeypatch):
+    blockfrost_api, counting_get, clock = counting_api(monkeypatch, {'epoch_params': 60})
+    blockfrost_api.get_protocol_parameters()
+    clock[0] += 59
+    blockfrost_api.get_protocol_parameters()
+    assert len(counting_get.urls) == 1
+    clock[0] += 1
+    assert blockfrost_api.get_protocol_parameters() == {'call': 2}, 'Expired entry was not refetched'
+
+def test_cache_disabled_for_unconfigured_category(monkeypatch):
+    blockfrost_api, counting_get, clock = counting_api(monkeypatch, {'epoch_params': 60})
+    blockfrost_api.get_tx_utxos('abc')
+    blockfrost_api.get_tx_utxos('abc')
+    assert len(counting_get.urls) == 2, 'Category without a TTL should never be cached'
+
+def test_cache_evicts_oldest_entry(monkeypatch):
+    blockfrost_api, counting_get, clock = counting_api(monkeypatch, {'tx_utxos': 60})
+    for idx in range(BlockfrostApi._CACHE_MAX_ENTRIES + 1):
+        blockfrost_api.get_tx_utxos(f"hash{idx}")
+    num_fetched = len(counting_get.urls)
+    blockfrost_api.get_tx_utxos(f"hash{BlockfrostApi._CACHE_MAX_ENTRIES}")
+    blockfrost_api.get_tx_utxos('hash1')
+    assert len(counting_get.urls) == num_fetched, 'Recent entries should still be cached'
+    blockfrost_api.get_tx_utxos('hash0')
+    assert len(counting_get.urls) == num_fetched + 1, 'Oldest entry should have been evicted'
+
+def test_cached_batch_larger_than_cache(monkeypatch):
+    # Worker threads insert and evict concurrently, make them switch often
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        blockfrost_api, counting_get, clock = counting_api(monkeypatch, {'tx_utxos': 60})
+        txn_hashes = [f"hash{idx}" for idx in range(BlockfrostApi._CACHE_MAX_ENTRIES * 16)]
+        tx_utxos = blockfrost_api.get_tx_utxos_batch(txn_hashes)
+    finally:
+        sys.setswitchinterval(switch_interval)
+    assert sorted(tx_utxos.keys()) == sorted(txn_hashes), 'Cache updates from worker threads lost some lookups'
+    assert len(counting_get.urls) == len(txn_hashes), 'Each hash should be fetched exactly once'
+    assert len({id(utxos) for utxos in tx_utxos.values()}) == len(txn_hashes)
+
+class FlakyTxUtxos(object):
+
+    def __init__(self, failing_hashes):
+        self.failing_hashes = set(failing_hashes)
+        self.calls = []
+
+    def __call__(self, txn_hash):
+        self.calls.append(txn_hash)
+        if txn_hash in self.failing_hashes:
+            self.failing_hashes.remove(txn_hash)
+            raise ValueError(f"Transient failure for {txn_hash}")
+        return {'inputs': [{'address': f"addr_{txn_hash}", 'reference': False}], 'outputs': []}
+
+class RecordingWhitelist(NoWhitelist):
+
+    def __init__(self):
+        self.seen_utxos = {}
+
+    def required_info(self, mint_utxo, txn_utxos, blockfrost):
+        self.seen_utxos[mint_utxo.hash] = txn_utxos
+        raise ValueError('Stop vending after the UTxO lookup')
+
+def test_batch_omits_failed_hashes():
+    blockfrost_api = BlockfrostApi('project123')
+    blockfrost_api.get_tx_utxos = FlakyTxUtxos(['bad'])
+    tx_utxos = blockfrost_api.get_tx_utxos_batch(['good', 'bad', 'good', 'other'])
+    assert sorted(tx_utxos.keys()) == ['good', 'other']
+    assert sorted(blockfrost_api.get_tx_utxos.calls) == ['bad', 'good', 'other'], 'Duplicate hashes should be fetched once'
+
+def test_vend_refetches_hashes_missing_from_batch(monkeypatch, tmp_path):
+    monkeypatch.setattr(cardano.wt.nft_vending_machine.time, 'sleep', lambda seconds: None)
+    blockfrost_api = BlockfrostApi('project123')
+    blockfrost_api.get_tx_utxos = FlakyTxUtxos(['bad'])
+    mint_reqs = [Utxo(txn_hash, 0, [Balance(10000000, Balance.LOVELACE_POLICY)]) for txn_hash in ['good', 'bad']]
+    blockfrost_api.get_utxos = lambda address, exclusions: mint_reqs
+    whitelist = RecordingWhitelist()
+    mint = Mint(MINT_PRICE, 0, None, str(tmp_path), [], [], whitelist)
+    vending_machine = NftVendingMachine('addr123', None, 'addr456', False, 5, mint, blockfrost_api, CardanoCli(), mainnet=False)
+    vending_machine._NftVendingMachine__is_validated = True
+    vending_machine.vend(str(tmp_path), 'in_proc', 'metadata', set())
+    assert blockfrost_api.get_tx_utxos.calls.count('good') == 1, 'Prefetched UTxOs should be reused'
+    assert blockfrost_api.get_tx_utxos.calls.count('bad') == 2, 'Failed prefetch should be retried individually'
+    assert whitelist.seen_utxos['bad']['inputs'][0]['address'] == 'addr_bad'
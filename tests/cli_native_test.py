@@ -0,0 +1,13 @@
+import os
+
+from test_utils.fs import data_file_path
+
+from cardano.wt.cli_native import NativeCli
+
+def test_builds_testnet_addr_from_signing_key(request):
+    sign_key = data_file_path(request, os.path.join('sign_keys', 'dummy.skey'))
+    assert NativeCli().build_addr(sign_key, mainnet=False) == 'addr_test1vplgrtqgphv0hpx2v6zyzwxxmyh0q4vjrzeuv7qvtk3ev2cmmgd54'
+
+def test_computes_policy_id_from_script(request):
+    simple_script = data_file_path(request, os.path.join('scripts', 'simple.script'))
+    assert NativeCli().policy_id(simple_script) == 'a8b0487ef4d9f4215e0ffcb9b5bc78b438c4e9fb8788656691ce753b'
@@ -0,0 +1,63 @@
+import glob
+import os
+import tempfile
+
+from cardano.wt.whitelist.filesystem import FilesystemBasedWhitelist
+
+WL_FILENAMES = ['abc_1', 'abc_2', 'abc_x1', 'abc_1_3', 'ab_1', '.abc_4', 'abcd_1', 'stake1u8_p1']
+
+def create_whitelist(filenames):
+    whitelist_dir = tempfile.mkdtemp()
+    consumed_dir = tempfile.mkdtemp()
+    for filename in filenames:
+        open(os.path.join(whitelist_dir, filename), 'w').close()
+    return FilesystemBasedWhitelist(whitelist_dir, consumed_dir)
+
+def test_num_whitelisted_matches_slot_glob():
+    whitelist = create_whitelist(WL_FILENAMES)
+    for identifier in ['abc', 'ab', 'abc_1', 'abcd', 'abc_x', 'stake1u8', 'missing']:
+        expected = len(glob.glob(f"{os.path.join(whitelist.input_dir, identifier)}_[0-9]*"))
+        actual = whitelist.num_whitelisted(identifier)
+        assert actual == expected, f"Mismatch for '{identifier}': {actual} != {expected}"
+
+def test_num_whitelisted_sees_added_slots():
+    whitelist = create_whitelist(['abc_1'])
+    assert whitelist.num_whitelisted('abc') == 1
+    open(os.path.join(whitelist.input_dir, 'abc_2'), 'w').close()
+    assert whitelist.num_whitelisted('abc') == 2, 'Index was not refreshed after the whitelist directory changed'
+
+def test_remove_from_whitelist_updates_count():
+    whitelist = create_whitelist(['abc_1', 'abc_2'])
+    whitelist._remove_from_whitelist('abc', 1)
+    assert whitelist.num_whitelisted('abc') == 1
+    assert len(os.listdir(whitelist.consumed_dir)) == 1
+
+def test_missing_whitelist_dir_has_no_slots():
+    whitelist = FilesystemBasedWhitelist(os.path.join(tempfile.mkdtemp(), 'missing'), tempfile.mkdtemp())
+    assert whitelist.num_whitelisted('abc') == 0
+
+def test_remove_from_whitelist_moves_linked_ids():
+    whitelist = create_whitelist(['abc_1', 'def_1'])
+    with open(os.path.join(whitelist.input_dir, 'abc_1'), 'w') as linked_ids:
+        linked_ids.write('def_1\nmissing_1\n')
+    whitelist._remove_from_whitelist('abc', 1)
+    assert sorted(os.listdir(whitelist.consumed_dir)) == ['abc_1', 'def_1']
+    assert whitelist.num_whitelisted('def') == 0, 'Linked ID should have been consumed with its slot'
+
+def test_remove_from_whitelist_within_same_mtime_tick():
+    whitelist = create_whitelist(['abc_1', 'abc_2'])
+    assert whitelist.num_whitelisted('abc') == 2
+    dir_stat = os.stat(whitelist.input_dir)
+    whitelist._remove_from_whitelist('abc', 1)
+    os.utime(whitelist.input_dir, ns=(dir_stat.st_atime_ns, dir_stat.st_mtime_ns))
+    assert whitelist.num_whitelisted('abc') == 1, 'Index still lists the slot that was just consumed'
+    whitelist._remove_from_whitelist('abc', 1)
+    assert whitelist.num_whitelisted('abc') == 0
+
+def test_num_whitelisted_sees_slots_added_within_same_mtime_tick():
+    whitelist = create_whitelist(['abc_1'])
+    assert whitelist.num_whitelisted('abc') == 1
+    dir_stat = os.stat(whitelist.input_dir)
+    open(os.path.join(whitelist.input_dir, 'abc_2'), 'w').close()
+    os.utime(whitelist.input_dir, ns=(dir_stat.st_atime_ns, dir_stat.st_mtime_ns))
+    assert whitelist.num_whitelisted('abc') == 2, 'Slot added in the same mtime tick as the last scan was missed'
@@ -5,7 +5,9 @@ import shutil
 from test_utils.fs import data_file_path
 from test_utils.vending_machine import vm_test_config, VendingMachineTestConfig
 
+from cardano.wt.cardano_cli import CardanoCli
 from cardano.wt.mint import Mint
+from cardano.wt.nft_vending_machine import NftVendingMachine
 from cardano.wt.utxo import Balance
 from cardano.wt.whitelist.no_whitelist import NoWhitelist
 
@@ -220,3 +222,34 @@ def test_rejects_if_duplicate_names_in_dir(request, vm_test_config):
         assert False, 'Successfully validated mint with overlapping asset names'
     except ValueError as e:
         assert "Found duplicate asset name '33568ad11f93b3e79ae8dee5ad928ded72adcea719e92108caf1521b.WildTangz 1'" in str(e)
+
+def test_loads_large_metadata_directory_in_parallel(request, vm_test_config):
+    simple_script = data_file_path(request, os.path.join('scripts', 'simple.script'))
+    policy = 'a' * 56
+    for idx in range(Mint._PARALLEL_LOAD_MIN):
+        with open(os.path.join(vm_test_config.metadata_dir, f"{idx}.json"), 'w') as metadata_file:
+            json.dump({'721': {policy: {f"Asset{idx}": {'name': f"Asset {idx}"}}}}, metadata_file)
+    mint = Mint(DUMMY_MINT_PRICE, None, None, vm_test_config.metadata_dir, [simple_script], [DUMMY_SIGN_KEY], NoWhitelist())
+    mint.validate()
+    assert sorted(mint.validated_names) == sorted([f"{policy}.Asset{idx}" for idx in range(Mint._PARALLEL_LOAD_MIN)])
+    with open(os.path.join(vm_test_config.metadata_dir, 'dupe.json'), 'w') as metadata_file:
+        json.dump({'721': {policy: {'Asset0': {'name': 'Asset 0'}}}}, metadata_file)
+    try:
+        mint.validate()
+        assert False, 'Successfully validated large metadata directory with a duplicate asset'
+    except ValueError as e:
+        assert f"Found duplicate asset name '{policy}.Asset0'" in str(e)
+
+def test_vends_metadata_accepted_by_validation(request, vm_test_config):
+    simple_script = data_file_path(request, os.path.join('scripts', 'simple.script'))
+    policy = 'a' * 56
+    metadata = json.dumps({'721': {policy: {'BomAsset': {'name': 'BOM Asset'}}}})
+    with open(os.path.join(vm_test_config.metadata_dir, 'bom.json'), 'wb') as metadata_file:
+        metadata_file.write(b'\xef\xbb\xbf' + metadata.encode('utf-8'))
+    mint = Mint(DUMMY_MINT_PRICE, None, None, vm_test_config.metadata_dir, [simple_script], [DUMMY_SIGN_KEY], NoWhitelist())
+    mint.validate()
+    assert mint.validated_names == [f"{policy}.BomAsset"]
+    vending_machine = NftVendingMachine('addr123', None, 'addr456', False, 5, mint, None, CardanoCli(), mainnet=False)
+    combined_file = vending_machine._NftVendingMachine__lock_and_merge(['bom.json'], 1, vm_test_config.root_dir, 'locked', 'in_proc', 12345)
+    with open(combined_file, 'r') as combined_handle:
+        assert json.load(combined_handle) == {'721': {policy: {'BomAsset': {'name': 'BOM Asset'}}}}
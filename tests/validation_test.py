@@ -180,3 +180,35 @@ def test_does_not_allow_mint_with_no_prices(request, vm_test_config):
         assert False, f"Successfully validated mint with no prices"
     except ValueError as e:
         assert 'Must specify at least one valid mint price, even if 0 ADA for free mint' in str(e)
+
+class CountingCardanoCli(CardanoCli):
+
+    def __init__(self, addr, policy):
+        super().__init__()
+        self.addr = addr
+        self.policy = policy
+        self.calls = 0
+
+    def build_addr(self, payment_sign_key, mainnet=False):
+        self.calls += 1
+        return self.addr
+
+    def policy_id(self, script_file):
+        self.calls += 1
+        return self.policy
+
+def test_validate_reuses_cached_cli_results(request, vm_test_config):
+    addr = 'addr_test1vplgrtqgphv0hpx2v6zyzwxxmyh0q4vjrzeuv7qvtk3ev2cmmgd54'
+    policy = '33568ad11f93b3e79ae8dee5ad928ded72adcea719e92108caf1521b'
+    simple_script = data_file_path(request, os.path.join('scripts', 'simple.script'))
+    sign_key = data_file_path(request, os.path.join('sign_keys', 'dummy.skey'))
+    good_file = data_file_path(request, os.path.join('success', 'WildTangz 1.json'))
+    shutil.copy(good_file, vm_test_config.metadata_dir)
+    cache_file = os.path.join(vm_test_config.root_dir, '.validated')
+    for expected_calls in [2, 0]:
+        cardano_cli = CountingCardanoCli(addr, policy)
+        mint = Mint(MINT_PRICE, 0, None, vm_test_config.metadata_dir, [simple_script], [sign_key], NoWhitelist())
+        vending_machine = NftVendingMachine(addr, sign_key, 'addr456', False, 5, mint, None, cardano_cli, mainnet=False)
+        vending_machine.validate(cache_file=cache_file)
+        assert cardano_cli.calls == expected_calls, f"Expected {expected_calls} cardano-cli calls, found {cardano_cli.calls}"
+        assert vending_machine.script_map == {policy: simple_script}